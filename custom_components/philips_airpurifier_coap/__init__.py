@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from ipaddress import IPv6Address, ip_address
+from ipaddress import ip_address
 import json
 import logging
-from os import path, walk
+from pathlib import Path
+from typing import Final
 
 from aioairctrl import CoAPClient
+from aiohttp import web
 from custom_components.philips_airpurifier_coap.config_entry_data import ConfigEntryData
 from custom_components.philips_airpurifier_coap.model import DeviceInformation
 from getmac import get_mac_address
@@ -18,7 +21,7 @@ from homeassistant.components.frontend import add_extra_js_url
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.components.http.view import HomeAssistantView
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.const import CONF_HOST, CONF_NAME, CONF_TIMEOUT
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.device_registry import format_mac
@@ -27,10 +30,13 @@ from .const import (
     CONF_DEVICE_ID,
     CONF_MODEL,
     CONF_STATUS,
+    DEFAULT_TIMEOUT,
     DOMAIN,
     ICONLIST_URL,
     ICONS,
+    ICONS_JSON,
     ICONS_PATH,
+    ICONS_URL,
     LOADER_PATH,
     LOADER_URL,
     PAP,
@@ -40,6 +46,43 @@ from .coordinator import Coordinator
 _LOGGER = logging.getLogger(__name__)
 PLATFORMS = ["fan", "binary_sensor", "sensor", "switch", "light", "select", "number"]
 
+# the icon set is fixed, so build the derived urls and paths only once
+_ICONS_SET_URL: Final = f"{ICONS_URL}/{PAP}"
+_ICONS_SET_PATH: Final = f"{ICONS_PATH}/{PAP}"
+_ICONLIST_SET_URL: Final = f"{ICONLIST_URL}/{PAP}"
+
+# cache of resolved mac addresses, so that a restart or reconfiguration
+# doesn't query the ARP table again for every device
+_MAC_CACHE: dict[str, str] = {}
+_MAC_CACHE_LOCK = asyncio.Lock()
+
+# ARP and hostname probes can take a while, so run them on a small dedicated
+# pool instead of starving the shared executor during the startup burst
+_MAC_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _get_mac_executor() -> ThreadPoolExecutor:
+    """Return the executor used for MAC address lookups."""
+
+    global _MAC_EXECUTOR
+
+    if _MAC_EXECUTOR is None:
+        _MAC_EXECUTOR = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="pap-mac"
+        )
+
+    return _MAC_EXECUTOR
+
+
+def _shutdown_mac_executor() -> None:
+    """Shut down the MAC lookup executor if it is running."""
+
+    global _MAC_EXECUTOR
+
+    if _MAC_EXECUTOR is not None:
+        _MAC_EXECUTOR.shutdown(wait=False)
+        _MAC_EXECUTOR = None
+
 
 class ListingView(HomeAssistantView):
     """Provide a json list of the used icons."""
@@ -52,7 +95,10 @@ class ListingView(HomeAssistantView):
         self.name = "Icon Listing"
 
     async def get(self, request):  # noqa: D102
-        return json.dumps(self._hass.data[DOMAIN][ICONS])
+        return web.Response(
+            body=self._hass.data[DOMAIN][ICONS_JSON],
+            content_type="application/json",
+        )
 
 
 async def async_setup(hass: HomeAssistant, config) -> bool:
@@ -62,38 +108,34 @@ async def async_setup(hass: HomeAssistant, config) -> bool:
     hass.http.register_static_path(LOADER_URL, hass.config.path(LOADER_PATH), True)
     add_extra_js_url(hass, LOADER_URL)
 
-    iset = PAP
-    iconpath = hass.config.path(ICONS_PATH + "/" + iset)
-
-    # walk the directory to get the icons
-    icons = []
-    for dirpath, _dirnames, filenames in walk(iconpath):
-        icons.extend(
-            [
-                {"name": path.join(dirpath[len(iconpath) :], fn[:-4])}
-                for fn in filenames
-                if fn.endswith(".svg")
-            ]
-        )
+    iconpath = hass.config.path(_ICONS_SET_PATH)
 
-    # store icons
-    data = hass.data.get(DOMAIN)
-    if data is None:
-        hass.data[DOMAIN] = {}
+    # scan the directory for icons in the executor to not block the event loop
+    icons = await hass.async_add_executor_job(
+        lambda: [
+            {"name": str(icon.relative_to(iconpath).with_suffix(""))}
+            for icon in Path(iconpath).rglob("*.svg")
+        ]
+    )
 
+    # store icons
+    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][ICONS] = icons
 
+    # the icon set is static after setup, so serialize the listing only once
+    hass.data[DOMAIN][ICONS_JSON] = json.dumps(icons).encode()
+
     # register path and view
     await hass.http.async_register_static_paths(
         [
             StaticPathConfig(
-                "/philips_airpurifier_coap/icons/pap",
-                "/workspaces/core/config/custom_components/philips_airpurifier_coap/icons/pap",
+                _ICONS_SET_URL,
+                iconpath,
                 True,
             )
         ]
     )
-    hass.http.register_view(ListingView(hass, ICONLIST_URL + "/" + iset))
+    hass.http.register_view(ListingView(hass, _ICONLIST_SET_URL))
 
     return True
 
@@ -102,29 +144,50 @@ async def async_get_mac_address_from_host(hass: HomeAssistant, host: str) -> str
     """Get mac address from host."""
     mac_address: str | None
 
+    # serve from the cache if the host has been resolved before
+    async with _MAC_CACHE_LOCK:
+        cached_mac = _MAC_CACHE.get(host)
+
+    if cached_mac is not None:
+        return cached_mac
+
+    # a device on this host may already have been set up before, in which
+    # case its config entry data carries the MAC and we can skip the ARP probe
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if not isinstance(entry_data, ConfigEntryData):
+            continue
+
+        device_information = entry_data.device_information
+
+        if device_information.host == host and device_information.mac is not None:
+            async with _MAC_CACHE_LOCK:
+                _MAC_CACHE[host] = device_information.mac
+
+            return device_information.mac
+
     # first we try if this is an ip address
     try:
         ip_addr = ip_address(host)
     except ValueError:
         # that didn't work, so try a hostname
-        mac_address = await hass.async_add_executor_job(
-            partial(get_mac_address, hostname=host)
+        mac_address = await hass.loop.run_in_executor(
+            _get_mac_executor(), partial(get_mac_address, hostname=host)
         )
     else:
         # it is an ip address, but it could be IPv4 or IPv6
-        if ip_addr.version == 4:
-            mac_address = await hass.async_add_executor_job(
-                partial(get_mac_address, ip=host)
-            )
-        else:
-            ip_addr = IPv6Address(int(ip_addr))
-            mac_address = await hass.async_add_executor_job(
-                partial(get_mac_address, ip6=str(ip_addr))
-            )
+        kwarg = "ip" if ip_addr.version == 4 else "ip6"
+        mac_address = await hass.loop.run_in_executor(
+            _get_mac_executor(), partial(get_mac_address, **{kwarg: str(ip_addr)})
+        )
     if not mac_address:
         return None
 
-    return format_mac(mac_address)
+    mac_address = format_mac(mac_address)
+
+    async with _MAC_CACHE_LOCK:
+        _MAC_CACHE[host] = mac_address
+
+    return mac_address
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -135,20 +198,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     name = entry.data[CONF_NAME]
     device_id = entry.data[CONF_DEVICE_ID]
     status = entry.data[CONF_STATUS]
-    mac = await async_get_mac_address_from_host(hass, host)
+    timeout = entry.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
 
+    # the MAC lookup and the CoAP connect are independent, so run them
+    # concurrently instead of paying for both waits in sequence
     try:
-        client = await asyncio.wait_for(CoAPClient.create(host), timeout=25)
-    except TimeoutError as ex:
-        _LOGGER.warning(r"Failed to connect to host %s: %s", host, ex)
+        async with asyncio.TaskGroup() as tg:
+            mac_task = tg.create_task(async_get_mac_address_from_host(hass, host))
+            client_task = tg.create_task(
+                asyncio.wait_for(CoAPClient.create(host), timeout=timeout)
+            )
+    except* TimeoutError as ex:
+        _LOGGER.warning(r"Failed to connect to host %s: %s", host, ex.exceptions[0])
 
         raise ConfigEntryNotReady from ex
 
+    mac = mac_task.result()
+    client = client_task.result()
+
     device_information = DeviceInformation(
         host=host, mac=mac, model=model, name=name, device_id=device_id
     )
 
-    coordinator = Coordinator(hass, client, host, status)
+    coordinator = Coordinator(hass, client, host, status, connect_timeout=timeout)
 
     config_entry_data = ConfigEntryData(
         device_information=device_information,
@@ -156,7 +228,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         latest_status=status,
         client=client,
     )
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = config_entry_data
+    # hass.data[DOMAIN] is guaranteed to exist since async_setup ran
+    hass.data[DOMAIN][entry.entry_id] = config_entry_data
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -166,8 +239,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
 
-    for p in PLATFORMS:
-        await hass.config_entries.async_forward_entry_unload(entry, p)
+    await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     config_entry_data: ConfigEntryData = hass.data[DOMAIN][entry.entry_id]
 
@@ -175,4 +247,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
 
     hass.data[DOMAIN].pop(entry.entry_id)
 
+    # the MAC lookup pool is only needed while entries are loaded
+    if not any(
+        isinstance(data, ConfigEntryData) for data in hass.data[DOMAIN].values()
+    ):
+        _shutdown_mac_executor()
+
     return True
@@ -9,7 +9,7 @@ from custom_components.philips_airpurifier_coap.model import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigEntryData:
     """Config entry data class."""
 
@@ -41,6 +41,7 @@ DATA_KEY_FAN = "fan"
 DEFAULT_NAME = "Philips AirPurifier"
 
 MISSED_PACKAGE_COUNT = 3
+DEFAULT_TIMEOUT = 25
 
 
 class ICON(StrEnum):
@@ -88,6 +89,7 @@ ICONS_PATH = f"custom_components/{DOMAIN}/icons"
 
 PAP = "pap"
 ICONS = "icons"
+ICONS_JSON = "icons_json"
 
 CONF_MODEL = "model"
 CONF_DEVICE_ID = "device_id"
@@ -1,6 +1,7 @@
 import asyncio
 import contextlib
 import logging
+import random
 from asyncio import Task
 from collections.abc import Callable
 from typing import Any
@@ -8,11 +9,13 @@ from typing import Any
 from aioairctrl import CoAPClient
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 
-from .const import MISSED_PACKAGE_COUNT
+from .const import DEFAULT_TIMEOUT, MISSED_PACKAGE_COUNT
 from .timer import Timer
 
 _LOGGER = logging.getLogger(__name__)
 
+MAX_OBSERVE_FAILURES = 3
+
 
 class Coordinator:
     """Class to coordinate the data requests from the Philips API."""
@@ -23,6 +26,9 @@ class Coordinator:
         client: CoAPClient,
         host: str,
         status: dict[str, Any],
+        connect_timeout: int = DEFAULT_TIMEOUT,
+        missed_package_count: int = MISSED_PACKAGE_COUNT,
+        always_update: bool = False,
     ) -> None:
         """Initialize the coordinator."""
 
@@ -31,14 +37,21 @@ class Coordinator:
         self.host = host
         self.status = status
 
-        self._listeners: list[CALLBACK_TYPE] = []
+        # mirrors DataUpdateCoordinator: only notify listeners on changed
+        # data unless a caller explicitly opts into every update
+        self.always_update = always_update
+
+        self._connect_timeout = connect_timeout
+
+        self._listeners: dict[int, CALLBACK_TYPE] = {}
         self._task: Task | None = None
+        self._pending_notify: asyncio.TimerHandle | None = None
 
         self._reconnect_task: Task | None = None
         self._timeout: int = 60
 
         self._timer_disconnected = Timer(
-            timeout=self._timeout * MISSED_PACKAGE_COUNT,
+            timeout=self._timeout * missed_package_count,
             callback=self.reconnect,
             autostart=False,
         )
@@ -63,6 +76,10 @@ class Coordinator:
             )
             self._timer_disconnected.cancel()
 
+        if self._pending_notify is not None:
+            self._pending_notify.cancel()
+            self._pending_notify = None
+
         if self.client is not None:
             await self.client.shutdown()
 
@@ -91,23 +108,38 @@ class Coordinator:
             _LOGGER.exception("Exception on starting reconnect!")
 
     async def _reconnect(self):
-        try:
-            _LOGGER.debug("Reconnecting")
-            with contextlib.suppress(Exception):
-                await self.client.shutdown()
-            self.client = await CoAPClient.create(self.host)
-            self._start_observing()
-        except asyncio.CancelledError:
-            pass
-        except:
-            _LOGGER.exception("_reconnect error")
+        attempt = 0
+
+        while True:
+            try:
+                _LOGGER.debug("Reconnecting")
+                with contextlib.suppress(Exception):
+                    await self.client.shutdown()
+                self.client = await asyncio.wait_for(
+                    CoAPClient.create(self.host), timeout=self._connect_timeout
+                )
+                self._start_observing()
+                return
+            except asyncio.CancelledError:
+                return
+            except:
+                # back off exponentially with a little jitter so that flaky
+                # networks aren't hammered with reconnect attempts
+                delay = min(60, 2**attempt) + random.uniform(0, 1)
+                attempt += 1
+                _LOGGER.exception(
+                    "_reconnect error, retrying in %.1f seconds", delay
+                )
+                await asyncio.sleep(delay)
 
     @callback
     def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
         """Listen for data updates."""
 
+        key = id(update_callback)
+
         start_observing = not self._listeners
-        self._listeners.append(update_callback)
+        self._listeners[key] = update_callback
 
         if start_observing:
             self._start_observing()
@@ -116,15 +148,15 @@ class Coordinator:
         def remove_listener() -> None:
             """Remove update listener."""
 
-            self.async_remove_listener(update_callback)
+            self._async_remove_listener(key)
 
         return remove_listener
 
     @callback
-    def async_remove_listener(self, update_callback) -> None:
+    def _async_remove_listener(self, key: int) -> None:
         """Remove data update."""
 
-        self._listeners.remove(update_callback)
+        self._listeners.pop(key, None)
 
         if not self._listeners and self._task:
             self._task.cancel()
@@ -133,14 +165,71 @@ class Coordinator:
     async def _async_observe_status(self) -> None:
         """Fetch the status of the device."""
 
-        async for status in self.client.observe_status():
-            _LOGGER.debug("Status update: %s", status)
+        failures = 0
+
+        while True:
+            try:
+                async for status in self.client.observe_status():
+                    _LOGGER.debug("Status update: %s", status)
+
+                    failures = 0
+
+                    # most packets are observe refreshes carrying an identical
+                    # payload, so skip the fan-out when nothing changed; the
+                    # comparison is against the current status contents, not
+                    # the previous packet, so a packet that contradicts an
+                    # optimistic entity update still gets through
+                    if not self.always_update:
+                        try:
+                            unchanged = hash(tuple(sorted(status.items()))) == hash(
+                                tuple(sorted(self.status.items()))
+                            )
+                        except TypeError:
+                            unchanged = False
+
+                        if unchanged:
+                            continue
+                    self.status = status
+                    # self._timer_disconnected.reset()
+
+                    # coalesce bursts of status packets into a single
+                    # notification carrying the latest status
+                    if self._pending_notify is None:
+                        self._pending_notify = self.hass.loop.call_later(
+                            0.05, self._notify_listeners
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # transient errors only restart the observation in place,
+                # a full reconnect is the last resort
+                failures += 1
+
+                if failures >= MAX_OBSERVE_FAILURES:
+                    _LOGGER.exception(
+                        "Observing status of host %s failed %s times, reconnecting",
+                        self.host,
+                        failures,
+                    )
+                    await self.reconnect()
+                    return
+
+                _LOGGER.exception(
+                    "Error observing status of host %s, restarting observation",
+                    self.host,
+                )
+                await asyncio.sleep(min(30, 2**failures))
+
+    @callback
+    def _notify_listeners(self) -> None:
+        """Notify all listeners of the latest status."""
 
-            self.status = status
-            # self._timer_disconnected.reset()
+        self._pending_notify = None
 
-            for update_callback in self._listeners:
-                update_callback()
+        # iterate over a snapshot so that a callback removing
+        # its listener doesn't mutate the list mid-iteration
+        for update_callback in tuple(self._listeners.values()):
+            update_callback()
 
     def _start_observing(self) -> None:
         """Schedule state observation."""
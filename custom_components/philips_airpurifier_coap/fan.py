@@ -11,10 +11,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .philips import model_to_class
+from .philips import resolve_model
 
 _LOGGER = logging.getLogger(__name__)
 
+# remember models that already failed to resolve to skip the lookup entirely
+_UNKNOWN_MODELS: set[str] = set()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -24,14 +27,21 @@ async def async_setup_entry(
     """Set up the fan platform."""
 
     config_entry_data: ConfigEntryData = hass.data[DOMAIN][entry.entry_id]
-    model_class = model_to_class.get(config_entry_data.device_information.model)
-
-    if model_class:
-        fan_entity = model_class(hass, entry, config_entry_data)
-    else:
-        _LOGGER.error(
-            "Unsupported model: %s", config_entry_data.device_information.model
-        )
+    model = config_entry_data.device_information.model
+
+    if model in _UNKNOWN_MODELS:
+        _LOGGER.error("Unsupported model: %s", model)
         return
 
+    resolved = resolve_model(model)
+
+    if resolved is None:
+        _UNKNOWN_MODELS.add(model)
+        _LOGGER.error("Unsupported model: %s", model)
+        return
+
+    model_class, _ = resolved
+
+    fan_entity = model_class(hass, entry, config_entry_data)
+
     async_add_entities([fan_entity])
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+import contextlib
 from datetime import timedelta
+from functools import lru_cache
 import logging
+import sys
+from types import MappingProxyType, SimpleNamespace
 from typing import Any
 
 from custom_components.philips_airpurifier_coap.config_entry_data import ConfigEntryData
@@ -35,6 +38,134 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# status keys that may hold the device name and model, by API generation
+_NAME_KEYS = (PhilipsApi.NAME, PhilipsApi.NEW_NAME, PhilipsApi.NEW2_NAME)
+
+# window within which rapid-fire commands are coalesced into one CoAP write
+_COMMAND_DEBOUNCE = 0.15
+_MODEL_KEYS = (PhilipsApi.MODEL_ID, PhilipsApi.NEW_MODEL_ID, PhilipsApi.NEW2_MODEL_ID)
+
+
+# canonical instance per unique pattern content, so classes that declare
+# byte-identical patterns end up sharing one frozen dict
+_SUBDICT_INTERN: dict[tuple, MappingProxyType] = {}
+
+
+def _intern_pattern(pattern: dict) -> MappingProxyType:
+    """Return the canonical frozen instance for a pattern dict."""
+
+    items = tuple(
+        (sys.intern(k), sys.intern(v) if isinstance(v, str) else v)
+        for k, v in sorted(pattern.items())
+    )
+
+    cached = _SUBDICT_INTERN.get(items)
+
+    if cached is None:
+        cached = _SUBDICT_INTERN.setdefault(items, MappingProxyType(dict(items)))
+
+    return cached
+
+
+def _freeze_patterns(patterns: dict[str, dict]) -> dict[str, MappingProxyType]:
+    """Freeze the pattern dicts and intern their string values.
+
+    The class-level patterns are never mutated, and interned values let the
+    comparisons in the hot status-matching paths use pointer equality.
+    """
+
+    return {name: _intern_pattern(pattern) for name, pattern in patterns.items()}
+
+
+def _substitute_keys(
+    patterns: dict[str, MappingProxyType], replace: list | None
+) -> dict[str, MappingProxyType]:
+    """Apply a REPLACE_* key substitution to the patterns once.
+
+    The result is used for status matching, so the substitution doesn't
+    have to be re-applied on every comparison.
+    """
+
+    if replace is None:
+        return patterns
+
+    return {
+        name: _intern_pattern(
+            {(replace[1] if k == replace[0] else k): v for k, v in pattern.items()}
+        )
+        for name, pattern in patterns.items()
+    }
+
+
+def _build_pattern_index(
+    patterns: dict[str, MappingProxyType],
+) -> dict[tuple, dict[tuple, str]]:
+    """Build a reverse index from status values to pattern names.
+
+    Patterns are grouped by their key tuple, so matching a status takes one
+    dict lookup per distinct key set instead of scanning every pattern.
+    """
+
+    index: dict[tuple, dict[tuple, str]] = {}
+
+    for name, pattern in patterns.items():
+        keys = tuple(sorted(pattern))
+        index.setdefault(keys, {})[tuple(pattern[k] for k in keys)] = name
+
+    return index
+
+
+def _classic_pattern(
+    mode: str | None = None, speed: str | None = None
+) -> MappingProxyType:
+    """Build a classic power/mode/speed pattern as one shared instance.
+
+    The classic protocol models only differ in their mode and speed
+    letters, so their tables can be written as compact calls instead of
+    spelling out the same dict literals over and over.
+    """
+
+    pattern: dict = {PhilipsApi.POWER: "1"}
+
+    if mode is not None:
+        pattern[PhilipsApi.MODE] = mode
+
+    if speed is not None:
+        pattern[PhilipsApi.SPEED] = speed
+
+    return _intern_pattern(pattern)
+
+
+# the most widely shared classic patterns, named for readability
+_PATTERN_AUTO = _classic_pattern(mode="P")
+_PATTERN_ALLERGEN = _classic_pattern(mode="A")
+_PATTERN_BACTERIA = _classic_pattern(mode="B")
+_PATTERN_SLEEP_S = _classic_pattern(mode="S", speed="s")
+_PATTERN_SLEEP_M = _classic_pattern(mode="M", speed="s")
+_PATTERN_SPEED_1 = _classic_pattern(mode="M", speed="1")
+_PATTERN_SPEED_2 = _classic_pattern(mode="M", speed="2")
+_PATTERN_SPEED_3 = _classic_pattern(mode="M", speed="3")
+_PATTERN_TURBO = _classic_pattern(mode="M", speed="t")
+
+
+# tables shared verbatim by many models, one canonical tuple each
+_SEL_PREFERRED = (PhilipsApi.PREFERRED_INDEX,)
+_SEL_GAS_PREFERRED = (PhilipsApi.GAS_PREFERRED_INDEX,)
+_SW_CHILD_LOCK = (PhilipsApi.CHILD_LOCK,)
+
+# NEW2 status keys repeated throughout the pattern tables below, bound
+# once so the class bodies don't re-resolve the attribute each time
+_NEW2_POWER = PhilipsApi.NEW2_POWER
+_NEW2_MODE_A = PhilipsApi.NEW2_MODE_A
+_NEW2_MODE_B = PhilipsApi.NEW2_MODE_B
+_NEW2_MODE_C = PhilipsApi.NEW2_MODE_C
+
+# sensor keys individual NEW2 models don't report, shared by reference;
+# frozensets give the registration loop O(1) exclusion checks
+_NEW2_UNAVAIL_FAN_SPEED = frozenset({PhilipsApi.NEW2_FAN_SPEED})
+_NEW2_UNAVAIL_GAS = frozenset({PhilipsApi.NEW2_GAS})
+_NEW2_UNAVAIL_FAN_GAS = _NEW2_UNAVAIL_FAN_SPEED | _NEW2_UNAVAIL_GAS
+
 
 class PhilipsEntity(Entity):
     """Class to represent a generic Philips entity."""
@@ -49,8 +180,8 @@ class PhilipsEntity(Entity):
 
         super().__init__()
 
-        self.hass = hass
-        self.config_entry = entry
+        # hass is managed by the Entity base class when the entity is added,
+        # and the config entry itself is never read by the entities
         self.config_entry_data = config_entry_data
         self.coordinator = self.config_entry_data.coordinator
 
@@ -75,13 +206,22 @@ class PhilipsEntity(Entity):
 
         return False
 
+    @callback
+    def _push_state(self) -> None:
+        """Write the current state to hass."""
+
+        self.async_write_ha_state()
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        self.config_entry_data.latest_status = self._device_status
+        # the coordinator swaps the status dict on observed updates, so
+        # only reassign when the reference actually changed
+        if self.config_entry_data.latest_status is not self._device_status:
+            self.config_entry_data.latest_status = self._device_status
 
-        self.async_write_ha_state()
+        self._push_state()
 
 
 class PhilipsGenericFan(PhilipsEntity, FanEntity):
@@ -97,38 +237,16 @@ class PhilipsGenericFan(PhilipsEntity, FanEntity):
 
         super().__init__(hass, entry, config_entry_data)
 
-        self._attr_name = list(
-            filter(
-                None,
-                map(
-                    self._device_status.get,
-                    [
-                        PhilipsApi.NAME,
-                        PhilipsApi.NEW_NAME,
-                        PhilipsApi.NEW2_NAME,
-                    ],
-                ),
-            )
-        )[0]
+        self._attr_name = next(
+            filter(None, map(self._device_status.get, _NAME_KEYS))
+        )
         self._attr_unique_id = (
             f"{slugify(self.config_entry_data.device_information.device_id)}_fan"
         )
         self._attr_device_info = DeviceInfo(
             name=self._attr_name,
             manufacturer=MANUFACTURER,
-            model=list(
-                filter(
-                    None,
-                    map(
-                        self._device_status.get,
-                        [
-                            PhilipsApi.MODEL_ID,
-                            PhilipsApi.NEW_MODEL_ID,
-                            PhilipsApi.NEW2_MODEL_ID,
-                        ],
-                    ),
-                )
-            )[0],
+            model=next(filter(None, map(self._device_status.get, _MODEL_KEYS))),
             sw_version=self._device_status["WifiVersion"],
             serial_number=self._device_status[PhilipsApi.DEVICE_ID],
             identifiers={(DOMAIN, self._device_status[PhilipsApi.DEVICE_ID])},
@@ -147,11 +265,11 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
     REPLACE_PRESET = None
     AVAILABLE_SPEEDS = {}
     REPLACE_SPEED = None
-    AVAILABLE_ATTRIBUTES = []
-    AVAILABLE_SWITCHES = []
-    AVAILABLE_LIGHTS = []
-    AVAILABLE_NUMBERS = []
-    AVAILABLE_BINARY_SENSORS = []
+    AVAILABLE_ATTRIBUTES = ()
+    AVAILABLE_SWITCHES = ()
+    AVAILABLE_LIGHTS = ()
+    AVAILABLE_NUMBERS = ()
+    AVAILABLE_BINARY_SENSORS = ()
 
     KEY_PHILIPS_POWER = PhilipsApi.POWER
     STATE_POWER_ON = "1"
@@ -159,6 +277,150 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
 
     KEY_OSCILLATION = None
 
+    # merged class hierarchy configuration, computed once per subclass
+    _MERGED_PRESET_MODES: dict = {}
+    _MERGED_PRESET_MODE_KEYS: tuple = ()
+    _PRESET_MODES_SET: frozenset = frozenset()
+    _MERGED_SPEEDS: dict = {}
+    _MERGED_SPEED_KEYS: tuple = ()
+    _SPEEDS_SET: frozenset = frozenset()
+    _MERGED_ATTRIBUTES: list = []
+    _NORMALIZED_ATTRIBUTES: list = []
+    _PRESET_INDEX: dict = {}
+    _SPEED_INDEX: dict = {}
+
+    # patterns with the REPLACE_* key substitution already applied,
+    # used for status matching instead of the raw write patterns
+    _PRESET_MATCH_PATTERNS: dict = {}
+    _SPEED_MATCH_PATTERNS: dict = {}
+
+    # plain-dict payload templates, copied by the command paths instead of
+    # rebuilding a dict from the frozen patterns on every send
+    _PRESET_PAYLOADS: dict = {}
+    _SPEED_PAYLOADS: dict = {}
+
+    # status keys that determine the icon, computed once per subclass
+    _ICON_KEYS: tuple = ()
+
+    # oscillation constants derived from KEY_OSCILLATION, computed once
+    _OSC_KEY: str | None = None
+    _OSC_ON: Any = None
+    _OSC_OFF: Any = None
+    _OSC_ON_SET: frozenset = frozenset()
+    _OSC_ON_VALUE: Any = None
+
+    # class tables that are frozen in place when a subclass is created
+    _TABLE_DICTS = ("AVAILABLE_PRESET_MODES", "AVAILABLE_SPEEDS")
+    _TABLE_LISTS = (
+        "AVAILABLE_ATTRIBUTES",
+        "AVAILABLE_SELECTS",
+        "AVAILABLE_SWITCHES",
+        "AVAILABLE_LIGHTS",
+        "AVAILABLE_NUMBERS",
+        "AVAILABLE_BINARY_SENSORS",
+        "UNAVAILABLE_SENSORS",
+        "UNAVAILABLE_FILTERS",
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """Merge the configuration of the class hierarchy once per subclass."""
+
+        super().__init_subclass__(**kwargs)
+
+        # freeze the tables the subclass declares itself: read-only dicts
+        # keep the shared pattern instances safe from accidental mutation,
+        # and tuples iterate faster than lists
+        declared = vars(cls)
+
+        for attr in cls._TABLE_DICTS:
+            value = declared.get(attr)
+            if isinstance(value, dict):
+                setattr(cls, attr, MappingProxyType(value))
+
+        for attr in cls._TABLE_LISTS:
+            value = declared.get(attr)
+            if isinstance(value, list):
+                setattr(cls, attr, tuple(value))
+
+        preset_modes = {}
+        speeds = {}
+        attributes = []
+
+        for klass in reversed(cls.__mro__):
+            preset_modes.update(getattr(klass, "AVAILABLE_PRESET_MODES", {}))
+            speeds.update(getattr(klass, "AVAILABLE_SPEEDS", {}))
+            attributes.extend(getattr(klass, "AVAILABLE_ATTRIBUTES", []))
+
+        # devices answer on exactly one power key per API generation; a
+        # legacy key that slips into a pattern is normalized here so the
+        # send path never has to branch on it
+        if cls.KEY_PHILIPS_POWER != PhilipsApi.POWER:
+            for table in (preset_modes, speeds):
+                for name, pattern in table.items():
+                    if PhilipsApi.POWER in pattern:
+                        _LOGGER.debug(
+                            "%s: replacing legacy power key in pattern %s",
+                            cls.__name__,
+                            name,
+                        )
+                        table[name] = {
+                            (cls.KEY_PHILIPS_POWER if k == PhilipsApi.POWER else k): v
+                            for k, v in pattern.items()
+                        }
+
+        preset_modes = _freeze_patterns(preset_modes)
+        speeds = _freeze_patterns(speeds)
+
+        cls._MERGED_PRESET_MODES = preset_modes
+        cls._MERGED_PRESET_MODE_KEYS = tuple(preset_modes)
+        cls._PRESET_MODES_SET = frozenset(preset_modes)
+        cls._MERGED_SPEEDS = speeds
+        cls._MERGED_SPEED_KEYS = tuple(speeds)
+        cls._SPEEDS_SET = frozenset(speeds)
+        cls._MERGED_ATTRIBUTES = attributes
+
+        # pre-split the optional value map and the key suffix so the
+        # extra_state_attributes hot path is a straight loop
+        cls._NORMALIZED_ATTRIBUTES = [
+            (key, philips_key.partition("#")[0], rest[0] if rest else None)
+            for key, philips_key, *rest in attributes
+        ]
+
+        cls._PRESET_MATCH_PATTERNS = _substitute_keys(preset_modes, cls.REPLACE_PRESET)
+        cls._SPEED_MATCH_PATTERNS = _substitute_keys(speeds, cls.REPLACE_SPEED)
+
+        cls._PRESET_PAYLOADS = {
+            name: dict(pattern) for name, pattern in preset_modes.items()
+        }
+        cls._SPEED_PAYLOADS = {name: dict(pattern) for name, pattern in speeds.items()}
+
+        cls._PRESET_INDEX = _build_pattern_index(cls._PRESET_MATCH_PATTERNS)
+        cls._SPEED_INDEX = _build_pattern_index(cls._SPEED_MATCH_PATTERNS)
+
+        # the icon only depends on the power state and the preset-defining
+        # keys, collect them so updates can cheaply detect icon changes
+        icon_keys = {cls.KEY_PHILIPS_POWER}
+        for keys in cls._PRESET_INDEX:
+            icon_keys.update(keys)
+        cls._ICON_KEYS = tuple(icon_keys)
+
+        # derive the oscillation key and values once instead of unpacking
+        # the nested dict on every property read and command
+        if cls.KEY_OSCILLATION is not None:
+            key = next(iter(cls.KEY_OSCILLATION))
+            values = cls.KEY_OSCILLATION[key]
+            on = values.get(SWITCH_ON)
+
+            cls._OSC_KEY = key
+            cls._OSC_ON = on
+            cls._OSC_OFF = values.get(SWITCH_OFF)
+            # only real lists enumerate several on values; any scalar,
+            # including multi-character strings, is a single member
+            cls._OSC_ON_SET = (
+                frozenset(on) if isinstance(on, list) else frozenset({on})
+            )
+            cls._OSC_ON_VALUE = on[0] if isinstance(on, list) else on
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -169,54 +431,163 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
 
         super().__init__(hass, entry, config_entry_data)
 
-        self._preset_modes = []
-        self._available_preset_modes = {}
-        self._collect_available_preset_modes()
+        cls = type(self)
 
-        self._speeds = []
-        self._available_speeds = {}
-        self._collect_available_speeds()
+        self._available_preset_modes = cls._MERGED_PRESET_MODES
+        self._preset_modes = cls._MERGED_PRESET_MODE_KEYS
 
-        self._available_attributes = []
-        self._collect_available_attributes()
+        self._available_speeds = cls._MERGED_SPEEDS
+        self._speeds = cls._MERGED_SPEED_KEYS
 
-    def _collect_available_preset_modes(self):
-        preset_modes = {}
+        self._available_attributes = cls._MERGED_ATTRIBUTES
 
-        for cls in reversed(self.__class__.__mro__):
-            cls_preset_modes = getattr(cls, "AVAILABLE_PRESET_MODES", {})
-            preset_modes.update(cls_preset_modes)
+        self._pending_data: dict | None = None
+        self._debounce_task: asyncio.Task | None = None
 
-        self._available_preset_modes = preset_modes
-        self._preset_modes = list(self._available_preset_modes.keys())
+        self._cached_is_on = self._compute_is_on()
 
-    def _collect_available_speeds(self):
-        speeds = {}
+        self._icon_sig = tuple(map(self._device_status.get, self._ICON_KEYS))
+        self._cached_icon = self._compute_icon()
 
-        for cls in reversed(self.__class__.__mro__):
-            cls_speeds = getattr(cls, "AVAILABLE_SPEEDS", {})
-            speeds.update(cls_speeds)
+        # the feature set only depends on class configuration, so
+        # compute it once instead of on every state write
+        self._attr_supported_features = FanEntityFeature.PRESET_MODE
 
-        self._available_speeds = speeds
-        self._speeds = list(self._available_speeds.keys())
+        if self._speeds:
+            self._attr_supported_features |= FanEntityFeature.SET_SPEED
 
-    def _collect_available_attributes(self):
-        attributes = []
+        if self.KEY_OSCILLATION is not None:
+            self._attr_supported_features |= FanEntityFeature.OSCILLATE
+
+    async def _async_wait_for_status(
+        self, key: str, value: Any, timeout: float = 3.0
+    ) -> None:
+        """Wait until the coordinator observes the given status value.
 
-        for cls in reversed(self.__class__.__mro__):
-            cls_attributes = getattr(cls, "AVAILABLE_ATTRIBUTES", [])
-            attributes.extend(cls_attributes)
+        Returns as soon as the device reports the value, or after the
+        timeout on congested links where the confirmation is delayed.
+        """
 
-        self._available_attributes = attributes
+        event = asyncio.Event()
+
+        @callback
+        def _check_status() -> None:
+            if self.coordinator.status.get(key) == value:
+                event.set()
+
+        remove_listener = self.coordinator.async_add_listener(_check_status)
+
+        try:
+            _check_status()
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(event.wait(), timeout)
+        finally:
+            remove_listener()
+
+    def _schedule_command(self, data: dict) -> None:
+        """Coalesce rapid-fire commands into a single CoAP write.
+
+        A slider drag in the UI fires many commands in quick succession;
+        only the last pattern within the debounce window is sent, so the
+        device isn't stuck working through a backlog of stale requests.
+        """
+
+        self._pending_data = data
+
+        if self._debounce_task is not None and not self._debounce_task.done():
+            self._debounce_task.cancel()
+
+        # keep a strong reference until the send finishes and surface
+        # any failure, the event loop only holds tasks weakly
+        task = asyncio.create_task(self._async_send_pending())
+        task.add_done_callback(self._async_command_done)
+        self._debounce_task = task
+
+    def _async_command_done(self, task: asyncio.Task) -> None:
+        """Release the finished command task and log failures."""
+
+        if self._debounce_task is task:
+            self._debounce_task = None
+
+        if task.cancelled():
+            return
+
+        exc = task.exception()
+
+        if exc is not None:
+            _LOGGER.error(
+                "Failed to send command to %s: %s", self._attr_name, exc
+            )
+
+    def _cancel_pending_command(self) -> None:
+        """Drop a not-yet-sent debounced command.
+
+        Immediate writes like turning off must cancel whatever is still in
+        the debounce window, otherwise a stale preset payload carrying a
+        power-on key could fire after the device was switched off.
+        """
+
+        self._pending_data = None
+
+        if self._debounce_task is not None and not self._debounce_task.done():
+            self._debounce_task.cancel()
+
+    async def _async_send_pending(self) -> None:
+        """Send the latest pending command after the debounce window."""
+
+        await asyncio.sleep(_COMMAND_DEBOUNCE)
+
+        data = self._pending_data
+        self._pending_data = None
+
+        if data:
+            await self.coordinator.client.set_control_values(data=data)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending command when the entity is removed."""
+
+        self._cancel_pending_command()
+
+        await super().async_will_remove_from_hass()
+
+    def _status_matches(self, status_pattern: dict) -> bool:
+        """Return whether the device status already matches the pattern."""
+
+        status = self._device_status
+
+        return all(status.get(k) == v for k, v in status_pattern.items())
+
+    def _compute_is_on(self) -> bool:
+        """Compute the power state from the device status."""
+
+        power_status = self._device_status.get(self.KEY_PHILIPS_POWER)
+
+        return power_status == self.STATE_POWER_ON
+
+    @callback
+    def _push_state(self) -> None:
+        """Write the current state to hass."""
+
+        # snapshot the power state once per update, it is read by several
+        # properties on every state write
+        self._cached_is_on = self._compute_is_on()
+
+        # only rerun the preset scan behind the icon when one of the
+        # keys feeding it actually changed, which is rare
+        icon_sig = tuple(map(self._device_status.get, self._ICON_KEYS))
+
+        if icon_sig != self._icon_sig:
+            self._icon_sig = icon_sig
+            self._cached_icon = self._compute_icon()
+
+        super()._push_state()
 
     @property
     def is_on(self) -> bool | None:
         """Return if the fan is on."""
 
-        power_status = self._device_status.get(self.KEY_PHILIPS_POWER)
-        is_on = power_status == self.STATE_POWER_ON
-
-        return is_on
+        return self._cached_is_on
 
     async def async_turn_on(
         self,
@@ -234,39 +605,29 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
             await self.async_set_percentage(percentage)
             return
 
+        self._cancel_pending_command()
+
         await self.coordinator.client.set_control_value(
             self.KEY_PHILIPS_POWER, self.STATE_POWER_ON
         )
 
         self._device_status[self.KEY_PHILIPS_POWER] = self.STATE_POWER_ON
-        self._handle_coordinator_update()
+        self._push_state()
 
     async def async_turn_off(self, **kwargs) -> None:
         """Turn the fan off."""
 
+        self._cancel_pending_command()
+
         await self.coordinator.client.set_control_value(
             self.KEY_PHILIPS_POWER, self.STATE_POWER_OFF
         )
 
         self._device_status[self.KEY_PHILIPS_POWER] = self.STATE_POWER_OFF
-        self._handle_coordinator_update()
-
-    @property
-    def supported_features(self) -> int:
-        """Return the supported features."""
-
-        features = FanEntityFeature.PRESET_MODE
-
-        if self._speeds:
-            features |= FanEntityFeature.SET_SPEED
-
-        if self.KEY_OSCILLATION is not None:
-            features |= FanEntityFeature.OSCILLATE
-
-        return features
+        self._push_state()
 
     @property
-    def preset_modes(self) -> list[str] | None:
+    def preset_modes(self) -> tuple[str, ...] | None:
         """Return the supported preset modes."""
 
         return self._preset_modes
@@ -275,27 +636,35 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
     def preset_mode(self) -> str | None:
         """Return the selected preset mode."""
 
-        for preset_mode, status_pattern in self._available_preset_modes.items():
-            for k, v in status_pattern.items():
-                if self.REPLACE_PRESET is not None and k == self.REPLACE_PRESET[0]:
-                    k = self.REPLACE_PRESET[1]
+        # bind to locals, this property runs on every state write
+        status_get = self._device_status.get
 
-                status = self._device_status.get(k)
+        for keys, entries in self._PRESET_INDEX.items():
+            preset_mode = entries.get(tuple(map(status_get, keys)))
 
-                if status != v:
-                    break
-            else:
+            if preset_mode is not None:
                 return preset_mode
 
+        return None
+
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode of the fan."""
 
-        status_pattern = self._available_preset_modes.get(preset_mode)
+        if preset_mode in self._PRESET_MODES_SET:
+            # don't issue a round-trip if the device is already in this mode
+            if self._status_matches(self._PRESET_MATCH_PATTERNS[preset_mode]):
+                return
+
+            data = self._PRESET_PAYLOADS[preset_mode].copy()
+
+            # fold the power-on into the same request instead of paying
+            # for a second round-trip when the device is off
+            if not self.is_on and self.KEY_PHILIPS_POWER not in data:
+                data[self.KEY_PHILIPS_POWER] = self.STATE_POWER_ON
 
-        if status_pattern:
-            await self.coordinator.client.set_control_values(data=status_pattern)
-            self._device_status.update(status_pattern)
-            self._handle_coordinator_update()
+            self._schedule_command(data)
+            self._device_status.update(data)
+            self._push_state()
 
     @property
     def speed_count(self) -> int:
@@ -307,55 +676,42 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
     def oscillating(self) -> bool | None:
         """Return if the fan is oscillating."""
 
-        if self.KEY_OSCILLATION is None:
+        if self._OSC_KEY is None:
             return None
 
-        key = next(iter(self.KEY_OSCILLATION))
-        status = self._device_status.get(key)
-        on = self.KEY_OSCILLATION.get(key).get(SWITCH_ON)
+        status = self._device_status.get(self._OSC_KEY)
 
         if status is None:
             return None
 
-        if isinstance(on, int):
-            return status == on
-
-        if isinstance(on, list):
-            return status in on
+        return status in self._OSC_ON_SET
 
     async def async_oscillate(self, oscillating: bool) -> None:
         """Osciallate the fan."""
 
-        if self.KEY_OSCILLATION is None:
+        if self._OSC_KEY is None:
             return None
 
-        key = next(iter(self.KEY_OSCILLATION))
-        values = self.KEY_OSCILLATION.get(key)
-        on = values.get(SWITCH_ON)
-        off = values.get(SWITCH_OFF)
+        value = self._OSC_ON_VALUE if oscillating else self._OSC_OFF
 
-        on_value = on if isinstance(on, int) else on[0]
+        self._cancel_pending_command()
 
-        if oscillating:
-            await self.coordinator.client.set_control_value(key, on_value)
-        else:
-            await self.coordinator.client.set_control_value(key, off)
+        await self.coordinator.client.set_control_value(self._OSC_KEY, value)
 
-        self._device_status[key] = on_value if oscillating else off
-        self._handle_coordinator_update()
+        self._device_status[self._OSC_KEY] = value
+        self._push_state()
 
     @property
     def percentage(self) -> int | None:
         """Return the speed percentages."""
 
-        for speed, status_pattern in self._available_speeds.items():
-            for k, v in status_pattern.items():
-                if self.REPLACE_SPEED is not None and k == self.REPLACE_SPEED[0]:
-                    k = self.REPLACE_SPEED[1]
+        # bind to locals, this property runs on every state write
+        status_get = self._device_status.get
+
+        for keys, entries in self._SPEED_INDEX.items():
+            speed = entries.get(tuple(map(status_get, keys)))
 
-                if self._device_status.get(k) != v:
-                    break
-            else:
+            if speed is not None:
                 return ordered_list_item_to_percentage(self._speeds, speed)
 
         return None
@@ -367,43 +723,49 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
             await self.async_turn_off()
         else:
             speed = percentage_to_ordered_list_item(self._speeds, percentage)
-            status_pattern = self._available_speeds.get(speed)
 
-            if status_pattern:
-                await self.coordinator.client.set_control_values(data=status_pattern)
-                self._handle_coordinator_update()
+            if speed in self._SPEEDS_SET:
+                # don't issue a round-trip if the device is already at this speed
+                if self._status_matches(self._SPEED_MATCH_PATTERNS[speed]):
+                    return
+
+                data = self._SPEED_PAYLOADS[speed].copy()
+
+                # fold the power-on into the same request instead of paying
+                # for a second round-trip when the device is off
+                if not self.is_on and self.KEY_PHILIPS_POWER not in data:
+                    data[self.KEY_PHILIPS_POWER] = self.STATE_POWER_ON
+
+                self._schedule_command(data)
+                self._device_status.update(data)
+                self._push_state()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the extra state attributes."""
 
-        def append(
-            attributes: dict,
-            key: str,
-            philips_key: str,
-            value_map: dict | Callable[[Any, Any], Any] = None,
-        ):
-            philips_clean_key = philips_key.partition("#")[0]
-
-            if philips_clean_key in self._device_status:
-                value = self._device_status[philips_clean_key]
-                if isinstance(value_map, dict) and value in value_map:
-                    value = value_map.get(value, "unknown")
-                    if isinstance(value, tuple):
-                        value = value[0]
-                elif callable(value_map):
-                    value = value_map(value, self._device_status)
-                attributes.update({key: value})
-
         device_attributes = {}
-        for key, philips_key, *rest in self._available_attributes:
-            value_map = rest[0] if len(rest) else None
-            append(device_attributes, key, philips_key, value_map)
+        status = self._device_status
+
+        for key, philips_clean_key, value_map in self._NORMALIZED_ATTRIBUTES:
+            if philips_clean_key not in status:
+                continue
+
+            value = status[philips_clean_key]
+
+            if isinstance(value_map, dict) and value in value_map:
+                value = value_map.get(value, "unknown")
+                if isinstance(value, tuple):
+                    value = value[0]
+            elif callable(value_map):
+                value = value_map(value, status)
+
+            device_attributes[key] = value
+
         return device_attributes
 
-    @property
-    def icon(self) -> str:
-        """Return the icon of the fan."""
+    def _compute_icon(self) -> str:
+        """Compute the icon of the fan from the device status."""
 
         if not self.is_on:
             return ICON.POWER_BUTTON
@@ -416,10 +778,18 @@ class PhilipsGenericCoAPFanBase(PhilipsGenericFan):
 
         return ICON.FAN_SPEED_BUTTON
 
+    @property
+    def icon(self) -> str:
+        """Return the icon of the fan."""
+
+        return self._cached_icon
+
 
 class PhilipsGenericCoAPFan(PhilipsGenericCoAPFanBase):
     """Class to manage a generic Philips CoAP fan."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {}
     AVAILABLE_SPEEDS = {}
 
@@ -446,15 +816,17 @@ class PhilipsGenericCoAPFan(PhilipsGenericCoAPFanBase):
         ),
     ]
 
-    AVAILABLE_LIGHTS = [PhilipsApi.DISPLAY_BACKLIGHT, PhilipsApi.LIGHT_BRIGHTNESS]
+    AVAILABLE_LIGHTS = (PhilipsApi.DISPLAY_BACKLIGHT, PhilipsApi.LIGHT_BRIGHTNESS)
 
-    AVAILABLE_SWITCHES = []
-    AVAILABLE_SELECTS = []
+    AVAILABLE_SWITCHES = ()
+    AVAILABLE_SELECTS = ()
 
 
 class PhilipsNewGenericCoAPFan(PhilipsGenericCoAPFanBase):
     """Class to manage a new generic CoAP fan."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {}
     AVAILABLE_SPEEDS = {}
 
@@ -478,9 +850,9 @@ class PhilipsNewGenericCoAPFan(PhilipsGenericCoAPFanBase):
         ),
     ]
 
-    AVAILABLE_LIGHTS = []
-    AVAILABLE_SWITCHES = []
-    AVAILABLE_SELECTS = [PhilipsApi.NEW_PREFERRED_INDEX]
+    AVAILABLE_LIGHTS = ()
+    AVAILABLE_SWITCHES = ()
+    AVAILABLE_SELECTS = (PhilipsApi.NEW_PREFERRED_INDEX,)
 
     KEY_PHILIPS_POWER = PhilipsApi.NEW_POWER
     STATE_POWER_ON = "ON"
@@ -490,6 +862,8 @@ class PhilipsNewGenericCoAPFan(PhilipsGenericCoAPFanBase):
 class PhilipsNew2GenericCoAPFan(PhilipsGenericCoAPFanBase):
     """Class to manage another new generic CoAP fan."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {}
     AVAILABLE_SPEEDS = {}
 
@@ -513,9 +887,9 @@ class PhilipsNew2GenericCoAPFan(PhilipsGenericCoAPFanBase):
         ),
     ]
 
-    AVAILABLE_LIGHTS = []
-    AVAILABLE_SWITCHES = []
-    AVAILABLE_SELECTS = []
+    AVAILABLE_LIGHTS = ()
+    AVAILABLE_SWITCHES = ()
+    AVAILABLE_SELECTS = ()
 
     KEY_PHILIPS_POWER = PhilipsApi.NEW2_POWER
     STATE_POWER_ON = 1
@@ -525,13 +899,17 @@ class PhilipsNew2GenericCoAPFan(PhilipsGenericCoAPFanBase):
 class PhilipsHumidifierMixin(PhilipsGenericCoAPFanBase):
     """Mixin for humidifiers."""
 
-    AVAILABLE_SELECTS = [PhilipsApi.FUNCTION, PhilipsApi.HUMIDITY_TARGET]
-    AVAILABLE_BINARY_SENSORS = [PhilipsApi.ERROR_CODE]
+    __slots__ = ()
+
+    AVAILABLE_SELECTS = (PhilipsApi.FUNCTION, PhilipsApi.HUMIDITY_TARGET)
+    AVAILABLE_BINARY_SENSORS = (PhilipsApi.ERROR_CODE,)
 
 
 class PhilipsAC0850(PhilipsNewGenericCoAPFan):
     """AC0850."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
         PresetMode.AUTO: {
             PhilipsApi.NEW_POWER: "ON",
@@ -544,12 +922,14 @@ class PhilipsAC0850(PhilipsNewGenericCoAPFan):
         PresetMode.SLEEP: {PhilipsApi.NEW_POWER: "ON", PhilipsApi.NEW_MODE: "Sleep"},
         PresetMode.TURBO: {PhilipsApi.NEW_POWER: "ON", PhilipsApi.NEW_MODE: "Turbo"},
     }
-    UNAVAILABLE_FILTERS = [PhilipsApi.FILTER_NANOPROTECT_PREFILTER]
+    UNAVAILABLE_FILTERS = (PhilipsApi.FILTER_NANOPROTECT_PREFILTER,)
 
 
 class PhilipsAC1715(PhilipsNewGenericCoAPFan):
     """AC1715."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
         PresetMode.AUTO: {
             PhilipsApi.NEW_POWER: "ON",
@@ -578,12 +958,14 @@ class PhilipsAC1715(PhilipsNewGenericCoAPFan):
         },
         PresetMode.TURBO: {PhilipsApi.NEW_POWER: "ON", PhilipsApi.NEW_MODE: "Turbo"},
     }
-    AVAILABLE_LIGHTS = [PhilipsApi.NEW_DISPLAY_BACKLIGHT]
+    AVAILABLE_LIGHTS = (PhilipsApi.NEW_DISPLAY_BACKLIGHT,)
 
 
 class PhilipsAC1214(PhilipsGenericCoAPFan):
     """AC1214."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
         PresetMode.AUTO: {PhilipsApi.MODE: "P"},
         PresetMode.ALLERGEN: {PhilipsApi.MODE: "A"},
@@ -600,83 +982,101 @@ class PhilipsAC1214(PhilipsGenericCoAPFan):
         PresetMode.SPEED_3: {PhilipsApi.MODE: "M", PhilipsApi.SPEED: "3"},
         PresetMode.TURBO: {PhilipsApi.MODE: "M", PhilipsApi.SPEED: "t"},
     }
-    AVAILABLE_SWITCHES = [PhilipsApi.CHILD_LOCK]
-    AVAILABLE_SELECTS = [PhilipsApi.PREFERRED_INDEX]
+    AVAILABLE_SWITCHES = _SW_CHILD_LOCK
+    AVAILABLE_SELECTS = _SEL_PREFERRED
 
     async def async_set_a(self) -> None:
         """Set the preset mode to Allergen."""
 
         _LOGGER.debug("AC1214 switches to mode 'A' first")
 
-        a_status_pattern = self._available_preset_modes.get(PresetMode.ALLERGEN)
+        await self.coordinator.client.set_control_values(
+            data=self._PRESET_PAYLOADS[PresetMode.ALLERGEN].copy()
+        )
+        await self._async_wait_for_status(PhilipsApi.MODE, "A")
+
+    async def _async_ensure_on(self) -> None:
+        """Switch the device on without setting a mode if it is off."""
+
+        # the AC1214 doesn't like it if we set a preset mode to switch on the device,
+        # so it needs to be done in sequence
+        if self.is_on:
+            return
 
-        await self.coordinator.client.set_control_values(data=a_status_pattern)
-        await asyncio.sleep(1)
+        _LOGGER.debug("AC1214 is switched on without setting a mode")
+        await self.coordinator.client.set_control_value(
+            PhilipsApi.POWER, PhilipsApi.POWER_MAP[SWITCH_ON]
+        )
+        await self._async_wait_for_status(
+            PhilipsApi.POWER, PhilipsApi.POWER_MAP[SWITCH_ON]
+        )
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode of the fan."""
 
         _LOGGER.debug("AC1214 async_set_preset_mode is called with: %s", preset_mode)
 
-        if not self.is_on:
-            _LOGGER.debug("AC1214 is switched on without setting a mode")
+        if not preset_mode:
+            return
 
-            await self.coordinator.client.set_control_value(
-                PhilipsApi.POWER, PhilipsApi.POWER_MAP[SWITCH_ON]
-            )
-            await asyncio.sleep(1)
+        status_pattern = self._available_preset_modes.get(preset_mode)
+        _LOGGER.debug("this corresponds to status pattern: %s", status_pattern)
 
-        current_pattern = self._available_preset_modes.get(self.preset_mode)
+        if not status_pattern:
+            return
 
+        await self._async_ensure_on()
+
+        current_pattern = self._available_preset_modes.get(self.preset_mode)
         _LOGGER.debug("AC1214 is currently on mode: %s", current_pattern)
 
-        if preset_mode:
-            _LOGGER.debug("AC1214 preset mode requested: %s", preset_mode)
-            status_pattern = self._available_preset_modes.get(preset_mode)
-            _LOGGER.debug("this corresponds to status pattern: %s", status_pattern)
-            if (
-                status_pattern
-                and status_pattern.get(PhilipsApi.MODE) != "A"
-                and current_pattern.get(PhilipsApi.MODE) != "M"
-            ):
-                await self.async_set_a()
-            _LOGGER.debug("AC1214 sets preset mode to: %s", preset_mode)
-            if status_pattern:
-                await self.coordinator.client.set_control_values(data=status_pattern)
+        # the AC1214 doesn't seem to like switching to mode 'M' without
+        # cycling through mode 'A'
+        if (
+            status_pattern.get(PhilipsApi.MODE) != "A"
+            and (current_pattern or {}).get(PhilipsApi.MODE) != "M"
+        ):
+            await self.async_set_a()
+
+        _LOGGER.debug("AC1214 sets preset mode to: %s", preset_mode)
+        await self.coordinator.client.set_control_values(
+            data=self._PRESET_PAYLOADS[preset_mode].copy()
+        )
 
     async def async_set_percentage(self, percentage: int) -> None:
         """Set the preset mode of the fan."""
         _LOGGER.debug("AC1214 async_set_percentage is called with: %s", percentage)
 
-        # the AC1214 doesn't like it if we set a preset mode to switch on the device,
-        # so it needs to be done in sequence
-        if not self.is_on:
-            _LOGGER.debug("AC1214 is switched on without setting a mode")
-            await self.coordinator.client.set_control_value(
-                PhilipsApi.POWER, PhilipsApi.POWER_MAP[SWITCH_ON]
-            )
-            await asyncio.sleep(1)
-
-        current_pattern = self._available_preset_modes.get(self.preset_mode)
-        _LOGGER.debug("AC1214 is currently on mode: %s", current_pattern)
         if percentage == 0:
             _LOGGER.debug("AC1214 uses 0% to switch off")
             await self.async_turn_off()
-        else:
-            # the AC1214 also doesn't seem to like switching to mode 'M' without cycling through mode 'A'
-            _LOGGER.debug("AC1214 speed change requested: %s", percentage)
-            speed = percentage_to_ordered_list_item(self._speeds, percentage)
-            status_pattern = self._available_speeds.get(speed)
-            _LOGGER.debug("this corresponds to status pattern: %s", status_pattern)
-            if (
-                status_pattern
-                and status_pattern.get(PhilipsApi.MODE) != "A"
-                and current_pattern.get(PhilipsApi.MODE) != "M"
-            ):
-                await self.async_set_a()
-            _LOGGER.debug("AC1214 sets speed percentage to: %s", percentage)
-            if status_pattern:
-                await self.coordinator.client.set_control_values(data=status_pattern)
+            return
+
+        _LOGGER.debug("AC1214 speed change requested: %s", percentage)
+        speed = percentage_to_ordered_list_item(self._speeds, percentage)
+        status_pattern = self._available_speeds.get(speed)
+        _LOGGER.debug("this corresponds to status pattern: %s", status_pattern)
+
+        if not status_pattern:
+            return
+
+        await self._async_ensure_on()
+
+        current_pattern = self._available_preset_modes.get(self.preset_mode)
+        _LOGGER.debug("AC1214 is currently on mode: %s", current_pattern)
+
+        # the AC1214 also doesn't seem to like switching to mode 'M' without
+        # cycling through mode 'A'
+        if (
+            status_pattern.get(PhilipsApi.MODE) != "A"
+            and (current_pattern or {}).get(PhilipsApi.MODE) != "M"
+        ):
+            await self.async_set_a()
+
+        _LOGGER.debug("AC1214 sets speed percentage to: %s", percentage)
+        await self.coordinator.client.set_control_values(
+            data=self._SPEED_PAYLOADS[speed].copy()
+        )
 
     async def async_turn_on(
         self,
@@ -690,15 +1090,9 @@ class PhilipsAC1214(PhilipsGenericCoAPFan):
             percentage,
             preset_mode,
         )
-        # the AC1214 doesn't like it if we set a preset mode to switch on the device,
-        # so it needs to be done in sequence
-        if not self.is_on:
-            _LOGGER.debug("AC1214 is switched on without setting a mode")
-            await self.coordinator.client.set_control_value(
-                PhilipsApi.POWER, PhilipsApi.POWER_MAP[SWITCH_ON]
-            )
-            await asyncio.sleep(1)
 
+        # the mode setters switch the device on themselves, so the power-on
+        # handshake is only done once per command
         if preset_mode:
             _LOGGER.debug("AC1214 preset mode requested: %s", preset_mode)
             await self.async_set_preset_mode(preset_mode)
@@ -708,6 +1102,8 @@ class PhilipsAC1214(PhilipsGenericCoAPFan):
             await self.async_set_percentage(percentage)
             return
 
+        await self._async_ensure_on()
+
 
 class PhilipsAC2729(
     PhilipsHumidifierMixin,
@@ -715,1012 +1111,546 @@ class PhilipsAC2729(
 ):
     """AC2729."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "P"},
-        PresetMode.ALLERGEN: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "A"},
+        PresetMode.AUTO: _PATTERN_AUTO,
+        PresetMode.ALLERGEN: _PATTERN_ALLERGEN,
         # make speeds available as preset
-        PresetMode.NIGHT: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "3",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.NIGHT: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.SPEED_3: _PATTERN_SPEED_3,
+        PresetMode.TURBO: _PATTERN_TURBO,
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.NIGHT: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "3",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.NIGHT: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.SPEED_3: _PATTERN_SPEED_3,
+        PresetMode.TURBO: _PATTERN_TURBO,
     }
-    AVAILABLE_SWITCHES = [PhilipsApi.CHILD_LOCK]
-    AVAILABLE_SELECTS = [PhilipsApi.PREFERRED_INDEX]
+    AVAILABLE_SWITCHES = _SW_CHILD_LOCK
+    AVAILABLE_SELECTS = _SEL_PREFERRED
 
 
 class PhilipsAC2889(PhilipsGenericCoAPFan):
     """AC2889."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "P"},
-        PresetMode.ALLERGEN: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "A"},
-        PresetMode.BACTERIA: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "B"},
+        PresetMode.AUTO: _PATTERN_AUTO,
+        PresetMode.ALLERGEN: _PATTERN_ALLERGEN,
+        PresetMode.BACTERIA: _PATTERN_BACTERIA,
         # make speeds available as preset
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "3",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_M,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.SPEED_3: _PATTERN_SPEED_3,
+        PresetMode.TURBO: _PATTERN_TURBO,
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "3",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_M,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.SPEED_3: _PATTERN_SPEED_3,
+        PresetMode.TURBO: _PATTERN_TURBO,
     }
-    AVAILABLE_SELECTS = [PhilipsApi.PREFERRED_INDEX]
+    AVAILABLE_SELECTS = _SEL_PREFERRED
 
 
 class PhilipsAC29xx(PhilipsGenericCoAPFan):
     """AC29xx family."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "AG"},
-        PresetMode.SLEEP: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "S"},
-        PresetMode.GENTLE: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "GT"},
-        PresetMode.TURBO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "T"},
+        PresetMode.AUTO: _classic_pattern(mode="AG"),
+        PresetMode.SLEEP: _classic_pattern(mode="S"),
+        PresetMode.GENTLE: _classic_pattern(mode="GT"),
+        PresetMode.TURBO: _classic_pattern(mode="T"),
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "S"},
-        PresetMode.GENTLE: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "GT"},
-        PresetMode.TURBO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "T"},
+        PresetMode.SLEEP: _classic_pattern(mode="S"),
+        PresetMode.GENTLE: _classic_pattern(mode="GT"),
+        PresetMode.TURBO: _classic_pattern(mode="T"),
     }
-    AVAILABLE_SELECTS = [PhilipsApi.PREFERRED_INDEX]
-    AVAILABLE_SWITCHES = [PhilipsApi.CHILD_LOCK]
-
-
-class PhilipsAC2936(PhilipsAC29xx):
-    """AC2936."""
-
-
-class PhilipsAC2939(PhilipsAC29xx):
-    """AC2939."""
-
-
-class PhilipsAC2958(PhilipsAC29xx):
-    """AC2958."""
-
-
-class PhilipsAC2959(PhilipsAC29xx):
-    """AC2959."""
+    AVAILABLE_SELECTS = _SEL_PREFERRED
+    AVAILABLE_SWITCHES = _SW_CHILD_LOCK
 
 
 class PhilipsAC303x(PhilipsGenericCoAPFan):
     """AC30xx family."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "AG"},
+        PresetMode.AUTO: _classic_pattern(mode="AG"),
         # make speeds available as preset
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SLEEP_ALLERGY: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "AS",
-            PhilipsApi.SPEED: "as",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SLEEP_ALLERGY: _classic_pattern(mode="AS", speed="as"),
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
-    AVAILABLE_SELECTS = [PhilipsApi.GAS_PREFERRED_INDEX]
-
-
-class PhilipsAC3033(PhilipsAC303x):
-    """AC3033."""
-
-
-class PhilipsAC3036(PhilipsAC303x):
-    """AC3036."""
-
-
-class PhilipsAC3039(PhilipsAC303x):
-    """AC3039."""
+    AVAILABLE_SELECTS = _SEL_GAS_PREFERRED
 
 
 class PhilipsAC305x(PhilipsGenericCoAPFan):
     """AC305x family."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "AG"},
+        PresetMode.AUTO: _classic_pattern(mode="AG"),
         # make speeds available as preset
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
-    AVAILABLE_SELECTS = [PhilipsApi.GAS_PREFERRED_INDEX]
-
-
-class PhilipsAC3055(PhilipsAC305x):
-    """AC3055."""
-
-
-class PhilipsAC3059(PhilipsAC305x):
-    """AC3059."""
+    AVAILABLE_SELECTS = _SEL_GAS_PREFERRED
 
 
 class PhilipsAC3259(PhilipsGenericCoAPFan):
     """AC3259."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "P"},
-        PresetMode.ALLERGEN: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "A"},
-        PresetMode.BACTERIA: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "B"},
+        PresetMode.AUTO: _PATTERN_AUTO,
+        PresetMode.ALLERGEN: _PATTERN_ALLERGEN,
+        PresetMode.BACTERIA: _PATTERN_BACTERIA,
         # make speeds available as preset
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "3",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_M,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.SPEED_3: _PATTERN_SPEED_3,
+        PresetMode.TURBO: _PATTERN_TURBO,
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "3",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_M,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.SPEED_3: _PATTERN_SPEED_3,
+        PresetMode.TURBO: _PATTERN_TURBO,
     }
-    AVAILABLE_SELECTS = [PhilipsApi.GAS_PREFERRED_INDEX]
+    AVAILABLE_SELECTS = _SEL_GAS_PREFERRED
 
 
 class PhilipsAC3737(PhilipsNew2GenericCoAPFan):
     """AC3737."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
         PresetMode.AUTO: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 2,
-            PhilipsApi.NEW2_MODE_B: 0,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 2,
+            _NEW2_MODE_B: 0,
         },
         PresetMode.SLEEP: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 2,
-            PhilipsApi.NEW2_MODE_B: 17,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 2,
+            _NEW2_MODE_B: 17,
         },
         PresetMode.TURBO: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 3,
-            PhilipsApi.NEW2_MODE_B: 18,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 3,
+            _NEW2_MODE_B: 18,
         },
     }
     AVAILABLE_SPEEDS = {
         PresetMode.SLEEP: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 2,
-            PhilipsApi.NEW2_MODE_B: 17,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 2,
+            _NEW2_MODE_B: 17,
         },
         PresetMode.SPEED_1: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 2,
-            PhilipsApi.NEW2_MODE_B: 1,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 2,
+            _NEW2_MODE_B: 1,
         },
         PresetMode.SPEED_2: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 2,
-            PhilipsApi.NEW2_MODE_B: 2,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 2,
+            _NEW2_MODE_B: 2,
         },
         PresetMode.TURBO: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 3,
-            PhilipsApi.NEW2_MODE_B: 18,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 3,
+            _NEW2_MODE_B: 18,
         },
     }
 
-    AVAILABLE_SELECTS = [PhilipsApi.NEW2_HUMIDITY_TARGET]
-    AVAILABLE_LIGHTS = [PhilipsApi.NEW2_DISPLAY_BACKLIGHT2]
-    AVAILABLE_SWITCHES = [PhilipsApi.NEW2_CHILD_LOCK]
-    UNAVAILABLE_SENSORS = [PhilipsApi.NEW2_FAN_SPEED]
-    AVAILABLE_BINARY_SENSORS = [PhilipsApi.NEW2_ERROR_CODE, PhilipsApi.NEW2_MODE_A]
+    AVAILABLE_SELECTS = (PhilipsApi.NEW2_HUMIDITY_TARGET,)
+    AVAILABLE_LIGHTS = (PhilipsApi.NEW2_DISPLAY_BACKLIGHT2,)
+    AVAILABLE_SWITCHES = (PhilipsApi.NEW2_CHILD_LOCK,)
+    UNAVAILABLE_SENSORS = _NEW2_UNAVAIL_FAN_SPEED
+    AVAILABLE_BINARY_SENSORS = (PhilipsApi.NEW2_ERROR_CODE, PhilipsApi.NEW2_MODE_A)
 
 
 class PhilipsAC3829(PhilipsHumidifierMixin, PhilipsGenericCoAPFan):
     """AC3829."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "P"},
-        PresetMode.ALLERGEN: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "A"},
+        PresetMode.AUTO: _PATTERN_AUTO,
+        PresetMode.ALLERGEN: _PATTERN_ALLERGEN,
         # make speeds available as preset
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "3",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.SPEED_3: _PATTERN_SPEED_3,
+        PresetMode.TURBO: _PATTERN_TURBO,
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "3",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.SPEED_3: _PATTERN_SPEED_3,
+        PresetMode.TURBO: _PATTERN_TURBO,
     }
-    AVAILABLE_SWITCHES = [PhilipsApi.CHILD_LOCK]
-    AVAILABLE_SELECTS = [PhilipsApi.GAS_PREFERRED_INDEX]
+    AVAILABLE_SWITCHES = _SW_CHILD_LOCK
+    AVAILABLE_SELECTS = _SEL_GAS_PREFERRED
 
 
 class PhilipsAC3836(PhilipsGenericCoAPFan):
     """AC3836."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "AG",
-            PhilipsApi.SPEED: "1",
-        },
+        PresetMode.AUTO: _classic_pattern(mode="AG", speed="1"),
         # make speeds available as preset
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
-    AVAILABLE_SELECTS = [PhilipsApi.GAS_PREFERRED_INDEX]
+    AVAILABLE_SELECTS = _SEL_GAS_PREFERRED
 
 
 class PhilipsAC385x50(PhilipsGenericCoAPFan):
     """AC385x/50 family."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "AG"},
+        PresetMode.AUTO: _classic_pattern(mode="AG"),
         # make speeds available as preset
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
-    AVAILABLE_SELECTS = [PhilipsApi.GAS_PREFERRED_INDEX]
-
-
-class PhilipsAC385450(PhilipsAC385x50):
-    """AC3854/50."""
-
-
-class PhilipsAC385850(PhilipsAC385x50):
-    """AC3858/50."""
+    AVAILABLE_SELECTS = _SEL_GAS_PREFERRED
 
 
 class PhilipsAC385x51(PhilipsGenericCoAPFan):
     """AC385x/51 family."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "AG"},
+        PresetMode.AUTO: _classic_pattern(mode="AG"),
         # make speeds available as preset
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SLEEP_ALLERGY: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "AS",
-            PhilipsApi.SPEED: "as",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SLEEP_ALLERGY: _classic_pattern(mode="AS", speed="as"),
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
-    AVAILABLE_SWITCHES = [PhilipsApi.CHILD_LOCK]
-    AVAILABLE_SELECTS = [PhilipsApi.GAS_PREFERRED_INDEX]
-
-
-class PhilipsAC385451(PhilipsAC385x51):
-    """AC3854/51."""
-
-
-class PhilipsAC385851(PhilipsAC385x51):
-    """AC3858/51."""
-
-
-class PhilipsAC385886(PhilipsAC385x51):
-    """AC3858/86."""
+    AVAILABLE_SWITCHES = _SW_CHILD_LOCK
+    AVAILABLE_SELECTS = _SEL_GAS_PREFERRED
 
 
 class PhilipsAC4236(PhilipsGenericCoAPFan):
     """AC4236."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "AG"},
+        PresetMode.AUTO: _classic_pattern(mode="AG"),
         # make speeds available as preset
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SLEEP_ALLERGY: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "AS",
-            PhilipsApi.SPEED: "as",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SLEEP_ALLERGY: _classic_pattern(mode="AS", speed="as"),
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "S",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "T",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_S,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.TURBO: _classic_pattern(mode="T", speed="t"),
     }
-    AVAILABLE_SWITCHES = [PhilipsApi.CHILD_LOCK]
-    AVAILABLE_SELECTS = [PhilipsApi.PREFERRED_INDEX]
+    AVAILABLE_SWITCHES = _SW_CHILD_LOCK
+    AVAILABLE_SELECTS = _SEL_PREFERRED
 
 
 class PhilipsAC4558(PhilipsGenericCoAPFan):
     """AC4558."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
         # there doesn't seem to be a manual mode, so no speed setting as part of preset
-        PresetMode.AUTO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "AG",
-            PhilipsApi.SPEED: "a",
-        },
-        PresetMode.GAS: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "F",
-            PhilipsApi.SPEED: "a",
-        },
+        PresetMode.AUTO: _classic_pattern(mode="AG", speed="a"),
+        PresetMode.GAS: _classic_pattern(mode="F", speed="a"),
         # it seems that when setting the pollution and allergen modes, we also need to set speed "a"
-        PresetMode.POLLUTION: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "P",
-            PhilipsApi.SPEED: "a",
-        },
-        PresetMode.ALLERGEN: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "A",
-            PhilipsApi.SPEED: "a",
-        },
+        PresetMode.POLLUTION: _classic_pattern(mode="P", speed="a"),
+        PresetMode.ALLERGEN: _classic_pattern(mode="A", speed="a"),
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {PhilipsApi.POWER: "1", PhilipsApi.SPEED: "s"},
-        PresetMode.SPEED_1: {PhilipsApi.POWER: "1", PhilipsApi.SPEED: "1"},
-        PresetMode.SPEED_2: {PhilipsApi.POWER: "1", PhilipsApi.SPEED: "2"},
-        PresetMode.TURBO: {PhilipsApi.POWER: "1", PhilipsApi.SPEED: "t"},
+        PresetMode.SLEEP: _classic_pattern(speed="s"),
+        PresetMode.SPEED_1: _classic_pattern(speed="1"),
+        PresetMode.SPEED_2: _classic_pattern(speed="2"),
+        PresetMode.TURBO: _classic_pattern(speed="t"),
     }
-    AVAILABLE_SELECTS = [PhilipsApi.PREFERRED_INDEX]
-    AVAILABLE_SWITCHES = [PhilipsApi.CHILD_LOCK]
-
-
-class PhilipsAC4550(PhilipsAC4558):
-    """AC4550."""
+    AVAILABLE_SELECTS = _SEL_PREFERRED
+    AVAILABLE_SWITCHES = _SW_CHILD_LOCK
 
 
 class PhilipsAC5659(PhilipsGenericCoAPFan):
     """AC5659."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
-        PresetMode.AUTO: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "P"},
-        PresetMode.ALLERGEN: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "A"},
-        PresetMode.BACTERIA: {PhilipsApi.POWER: "1", PhilipsApi.MODE: "B"},
+        PresetMode.AUTO: _PATTERN_AUTO,
+        PresetMode.ALLERGEN: _PATTERN_ALLERGEN,
+        PresetMode.BACTERIA: _PATTERN_BACTERIA,
         # make speeds available as preset
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "3",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_M,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.SPEED_3: _PATTERN_SPEED_3,
+        PresetMode.TURBO: _PATTERN_TURBO,
     }
     AVAILABLE_SPEEDS = {
-        PresetMode.SLEEP: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "s",
-        },
-        PresetMode.SPEED_1: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "1",
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "2",
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "3",
-        },
-        PresetMode.TURBO: {
-            PhilipsApi.POWER: "1",
-            PhilipsApi.MODE: "M",
-            PhilipsApi.SPEED: "t",
-        },
+        PresetMode.SLEEP: _PATTERN_SLEEP_M,
+        PresetMode.SPEED_1: _PATTERN_SPEED_1,
+        PresetMode.SPEED_2: _PATTERN_SPEED_2,
+        PresetMode.SPEED_3: _PATTERN_SPEED_3,
+        PresetMode.TURBO: _PATTERN_TURBO,
     }
-    AVAILABLE_SELECTS = [PhilipsApi.PREFERRED_INDEX]
+    AVAILABLE_SELECTS = _SEL_PREFERRED
 
 
 class PhilipsAMFxxx(PhilipsNew2GenericCoAPFan):
     """AMF family."""
 
+    __slots__ = ()
+
     # REPLACE_PRESET = [PhilipsApi.NEW2_MODE_B, PhilipsApi.NEW2_FAN_SPEED]
     AVAILABLE_PRESET_MODES = {
         # PresetMode.AUTO_PLUS: {
-        #     PhilipsApi.NEW2_POWER: 1,
-        #     PhilipsApi.NEW2_MODE_B: 0,
+        #     _NEW2_POWER: 1,
+        #     _NEW2_MODE_B: 0,
         #     PhilipsApi.NEW2_AUTO_PLUS_AI: 1,
-        #     # PhilipsApi.NEW2_MODE_C: 3,
+        #     # _NEW2_MODE_C: 3,
         # },
         PresetMode.AUTO: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 0,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_B: 0,
             # PhilipsApi.NEW2_AUTO_PLUS_AI: 0,
-            # PhilipsApi.NEW2_MODE_C: 3,
+            # _NEW2_MODE_C: 3,
         },
         PresetMode.SLEEP: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 17,
-            # PhilipsApi.NEW2_MODE_C: 1,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_B: 17,
+            # _NEW2_MODE_C: 1,
         },
         PresetMode.TURBO: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 18,
-            # PhilipsApi.NEW2_MODE_C: 18,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_B: 18,
+            # _NEW2_MODE_C: 18,
         },
     }
     # REPLACE_SPEED = [PhilipsApi.NEW2_MODE_B, PhilipsApi.NEW2_FAN_SPEED]
+    # the ten speed steps only differ in the NEW2_MODE_B value
     AVAILABLE_SPEEDS = {
-        PresetMode.SPEED_1: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 1,
-            # PhilipsApi.NEW2_MODE_C: 1,
-        },
-        PresetMode.SPEED_2: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 2,
-            # PhilipsApi.NEW2_MODE_C: 2,
-        },
-        PresetMode.SPEED_3: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 3,
-            # PhilipsApi.NEW2_MODE_C: 3,
-        },
-        PresetMode.SPEED_4: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 4,
-            # PhilipsApi.NEW2_MODE_C: 4,
-        },
-        PresetMode.SPEED_5: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 5,
-            # PhilipsApi.NEW2_MODE_C: 5,
-        },
-        PresetMode.SPEED_6: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 6,
-            # PhilipsApi.NEW2_MODE_C: 6,
-        },
-        PresetMode.SPEED_7: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 7,
-            # PhilipsApi.NEW2_MODE_C: 7,
-        },
-        PresetMode.SPEED_8: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 8,
-            # PhilipsApi.NEW2_MODE_C: 8,
-        },
-        PresetMode.SPEED_9: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 9,
-            # PhilipsApi.NEW2_MODE_C: 9,
-        },
-        PresetMode.SPEED_10: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_B: 10,
-            # PhilipsApi.NEW2_MODE_C: 10,
-        },
-        # PresetMode.TURBO: {
-        #     PhilipsApi.NEW2_POWER: 1,
-        #     PhilipsApi.NEW2_MODE_B: 18,
-        # },
+        preset_mode: {_NEW2_POWER: 1, _NEW2_MODE_B: step}
+        for step, preset_mode in enumerate(
+            (
+                PresetMode.SPEED_1,
+                PresetMode.SPEED_2,
+                PresetMode.SPEED_3,
+                PresetMode.SPEED_4,
+                PresetMode.SPEED_5,
+                PresetMode.SPEED_6,
+                PresetMode.SPEED_7,
+                PresetMode.SPEED_8,
+                PresetMode.SPEED_9,
+                PresetMode.SPEED_10,
+            ),
+            start=1,
+        )
+        # PresetMode.TURBO would be NEW2_MODE_B: 18
     }
 
-    AVAILABLE_LIGHTS = [PhilipsApi.NEW2_DISPLAY_BACKLIGHT]
-    AVAILABLE_SWITCHES = [
+    AVAILABLE_LIGHTS = (PhilipsApi.NEW2_DISPLAY_BACKLIGHT,)
+    AVAILABLE_SWITCHES = (
         PhilipsApi.NEW2_CHILD_LOCK,
         PhilipsApi.NEW2_BEEP,
         PhilipsApi.NEW2_STANDBY_SENSORS,
         PhilipsApi.NEW2_AUTO_PLUS_AI,
-    ]
-    AVAILABLE_SELECTS = [PhilipsApi.NEW2_TIMER]
-    AVAILABLE_NUMBERS = [PhilipsApi.NEW2_OSCILLATION]
+    )
+    AVAILABLE_SELECTS = (PhilipsApi.NEW2_TIMER,)
+    AVAILABLE_NUMBERS = (PhilipsApi.NEW2_OSCILLATION,)
 
 
 class PhilipsAMF765(PhilipsAMFxxx):
     """AMF765."""
 
-    AVAILABLE_SELECTS = [PhilipsApi.NEW2_CIRCULATION]
-    UNAVAILABLE_SENSORS = [PhilipsApi.NEW2_GAS]
+    __slots__ = ()
+
+    AVAILABLE_SELECTS = (PhilipsApi.NEW2_CIRCULATION,)
+    UNAVAILABLE_SENSORS = _NEW2_UNAVAIL_GAS
 
 
 class PhilipsAMF870(PhilipsAMFxxx):
     """AMF870."""
 
-    AVAILABLE_SELECTS = [
+    __slots__ = ()
+
+    AVAILABLE_SELECTS = (
         PhilipsApi.NEW2_GAS_PREFERRED_INDEX,
         PhilipsApi.NEW2_HEATING,
-    ]
-    AVAILABLE_NUMBERS = [PhilipsApi.NEW2_TARGET_TEMP]
+    )
+    AVAILABLE_NUMBERS = (PhilipsApi.NEW2_TARGET_TEMP,)
 
 
 class PhilipsCX5120(PhilipsNew2GenericCoAPFan):
     """CX5120."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
         PresetMode.AUTO: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 3,
-            PhilipsApi.NEW2_MODE_B: 0,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 3,
+            _NEW2_MODE_B: 0,
         },
         PresetMode.HIGH: {
-            PhilipsApi.POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 3,
-            PhilipsApi.NEW2_MODE_B: 65,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 3,
+            _NEW2_MODE_B: 65,
         },
         PresetMode.LOW: {
-            PhilipsApi.POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 3,
-            PhilipsApi.NEW2_MODE_B: 66,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 3,
+            _NEW2_MODE_B: 66,
         },
         PresetMode.VENTILATION: {
-            PhilipsApi.POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 1,
-            PhilipsApi.NEW2_MODE_B: -127,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 1,
+            _NEW2_MODE_B: -127,
         },
     }
     AVAILABLE_SPEEDS = {
         PresetMode.HIGH: {
-            PhilipsApi.POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 3,
-            PhilipsApi.NEW2_MODE_B: 65,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 3,
+            _NEW2_MODE_B: 65,
         },
         PresetMode.LOW: {
-            PhilipsApi.POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 3,
-            PhilipsApi.NEW2_MODE_B: 66,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 3,
+            _NEW2_MODE_B: 66,
         },
     }
     KEY_OSCILLATION = {
         PhilipsApi.NEW2_OSCILLATION: PhilipsApi.OSCILLATION_MAP,
     }
 
-    AVAILABLE_LIGHTS = [PhilipsApi.NEW2_DISPLAY_BACKLIGHT2]
-    AVAILABLE_SWITCHES = [PhilipsApi.NEW2_BEEP]
-    UNAVAILABLE_SENSORS = [PhilipsApi.NEW2_FAN_SPEED, PhilipsApi.NEW2_GAS]
-    AVAILABLE_SELECTS = [PhilipsApi.NEW2_TIMER2]
-    AVAILABLE_NUMBERS = [PhilipsApi.NEW2_TARGET_TEMP]
+    AVAILABLE_LIGHTS = (PhilipsApi.NEW2_DISPLAY_BACKLIGHT2,)
+    AVAILABLE_SWITCHES = (PhilipsApi.NEW2_BEEP,)
+    UNAVAILABLE_SENSORS = _NEW2_UNAVAIL_FAN_GAS
+    AVAILABLE_SELECTS = (PhilipsApi.NEW2_TIMER2,)
+    AVAILABLE_NUMBERS = (PhilipsApi.NEW2_TARGET_TEMP,)
 
 
 class PhilipsCX3550(PhilipsNew2GenericCoAPFan):
     """CX3550."""
 
+    __slots__ = ()
+
     AVAILABLE_PRESET_MODES = {
         PresetMode.NONE: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 1,
-            PhilipsApi.NEW2_MODE_B: 1,
-            PhilipsApi.NEW2_MODE_C: 1,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 1,
+            _NEW2_MODE_B: 1,
+            _NEW2_MODE_C: 1,
         },
         PresetMode.NATURAL: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 1,
-            PhilipsApi.NEW2_MODE_B: -126,
-            PhilipsApi.NEW2_MODE_C: 1,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 1,
+            _NEW2_MODE_B: -126,
+            _NEW2_MODE_C: 1,
         },
         PresetMode.SLEEP: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 1,
-            PhilipsApi.NEW2_MODE_B: 17,
-            PhilipsApi.NEW2_MODE_C: 2,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 1,
+            _NEW2_MODE_B: 17,
+            _NEW2_MODE_C: 2,
         },
     }
     AVAILABLE_SPEEDS = {
         PresetMode.SPEED_1: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 1,
-            PhilipsApi.NEW2_MODE_B: 1,
-            PhilipsApi.NEW2_MODE_C: 1,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 1,
+            _NEW2_MODE_B: 1,
+            _NEW2_MODE_C: 1,
         },
         PresetMode.SPEED_2: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 1,
-            PhilipsApi.NEW2_MODE_B: 2,
-            PhilipsApi.NEW2_MODE_C: 2,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 1,
+            _NEW2_MODE_B: 2,
+            _NEW2_MODE_C: 2,
         },
         PresetMode.SPEED_3: {
-            PhilipsApi.NEW2_POWER: 1,
-            PhilipsApi.NEW2_MODE_A: 1,
-            PhilipsApi.NEW2_MODE_B: 3,
-            PhilipsApi.NEW2_MODE_C: 3,
+            _NEW2_POWER: 1,
+            _NEW2_MODE_A: 1,
+            _NEW2_MODE_B: 3,
+            _NEW2_MODE_C: 3,
         },
     }
     KEY_OSCILLATION = {
         PhilipsApi.NEW2_OSCILLATION: PhilipsApi.OSCILLATION_MAP2,
     }
 
-    AVAILABLE_SWITCHES = [PhilipsApi.NEW2_BEEP]
-    AVAILABLE_SELECTS = [PhilipsApi.NEW2_TIMER2]
+    AVAILABLE_SWITCHES = (PhilipsApi.NEW2_BEEP,)
+    AVAILABLE_SELECTS = (PhilipsApi.NEW2_TIMER2,)
 
 
 model_to_class = {
@@ -1729,26 +1659,26 @@ model_to_class = {
     FanModel.AC1715: PhilipsAC1715,
     FanModel.AC2729: PhilipsAC2729,
     FanModel.AC2889: PhilipsAC2889,
-    FanModel.AC2936: PhilipsAC2936,
-    FanModel.AC2939: PhilipsAC2939,
-    FanModel.AC2958: PhilipsAC2958,
-    FanModel.AC2959: PhilipsAC2959,
-    FanModel.AC3033: PhilipsAC3033,
-    FanModel.AC3036: PhilipsAC3036,
-    FanModel.AC3039: PhilipsAC3039,
-    FanModel.AC3055: PhilipsAC3055,
-    FanModel.AC3059: PhilipsAC3059,
+    FanModel.AC2936: PhilipsAC29xx,
+    FanModel.AC2939: PhilipsAC29xx,
+    FanModel.AC2958: PhilipsAC29xx,
+    FanModel.AC2959: PhilipsAC29xx,
+    FanModel.AC3033: PhilipsAC303x,
+    FanModel.AC3036: PhilipsAC303x,
+    FanModel.AC3039: PhilipsAC303x,
+    FanModel.AC3055: PhilipsAC305x,
+    FanModel.AC3059: PhilipsAC305x,
     FanModel.AC3259: PhilipsAC3259,
     FanModel.AC3737: PhilipsAC3737,
     FanModel.AC3829: PhilipsAC3829,
     FanModel.AC3836: PhilipsAC3836,
-    FanModel.AC3854_50: PhilipsAC385450,
-    FanModel.AC3854_51: PhilipsAC385451,
-    FanModel.AC3858_50: PhilipsAC385850,
-    FanModel.AC3858_51: PhilipsAC385851,
-    FanModel.AC3858_86: PhilipsAC385886,
+    FanModel.AC3854_50: PhilipsAC385x50,
+    FanModel.AC3854_51: PhilipsAC385x51,
+    FanModel.AC3858_50: PhilipsAC385x50,
+    FanModel.AC3858_51: PhilipsAC385x51,
+    FanModel.AC3858_86: PhilipsAC385x51,
     FanModel.AC4236: PhilipsAC4236,
-    FanModel.AC4550: PhilipsAC4550,
+    FanModel.AC4550: PhilipsAC4558,
     FanModel.AC4558: PhilipsAC4558,
     FanModel.AC5659: PhilipsAC5659,
     FanModel.AMF765: PhilipsAMF765,
@@ -1756,3 +1686,76 @@ model_to_class = {
     FanModel.CX5120: PhilipsCX5120,
     FanModel.CX3550: PhilipsCX3550,
 }
+
+def _merge_mro_list(cls: type, attr: str) -> tuple:
+    """Merge a list-style class table across the class hierarchy."""
+
+    merged: list = []
+
+    for klass in reversed(cls.__mro__):
+        merged.extend(vars(klass).get(attr, ()))
+
+    return tuple(merged)
+
+
+@lru_cache(maxsize=None)
+def get_effective_spec(cls: type) -> SimpleNamespace:
+    """Return the merged platform configuration of a fan class.
+
+    The entity platforms need the class tables merged across the whole
+    hierarchy; memoizing per class turns the repeated MRO walks into a
+    single cache lookup keyed by class identity.
+    """
+
+    return SimpleNamespace(
+        preset_modes=cls._MERGED_PRESET_MODES,
+        speeds=cls._MERGED_SPEEDS,
+        attributes=cls._MERGED_ATTRIBUTES,
+        selects=_merge_mro_list(cls, "AVAILABLE_SELECTS"),
+        switches=_merge_mro_list(cls, "AVAILABLE_SWITCHES"),
+        lights=_merge_mro_list(cls, "AVAILABLE_LIGHTS"),
+        numbers=_merge_mro_list(cls, "AVAILABLE_NUMBERS"),
+        binary_sensors=_merge_mro_list(cls, "AVAILABLE_BINARY_SENSORS"),
+        unavailable_sensors=_merge_mro_list(cls, "UNAVAILABLE_SENSORS"),
+        unavailable_filters=_merge_mro_list(cls, "UNAVAILABLE_FILTERS"),
+    )
+
+
+# ordinal-indexed dispatch derived from model_to_class: resolving a model
+# becomes one small-dict probe plus a tuple index
+_MODEL_ORDINAL = {model: index for index, model in enumerate(FanModel)}
+_MODEL_TUPLE = tuple(model_to_class.get(model) for model in FanModel)
+
+
+def resolve_model_class(model: str) -> type[PhilipsGenericCoAPFanBase] | None:
+    """Resolve a model string to its fan class, or None if unsupported."""
+
+    index = _MODEL_ORDINAL.get(model)
+
+    if index is None:
+        return None
+
+    return _MODEL_TUPLE[index]
+
+
+@lru_cache(maxsize=None)
+def resolve_model(
+    model: str,
+) -> tuple[type[PhilipsGenericCoAPFanBase], SimpleNamespace] | None:
+    """Resolve a model string to its fan class and merged spec, cached.
+
+    Reloads and repeated probes of the same model hit the cache instead
+    of redoing the lookup and the spec merge.
+    """
+
+    model_class = resolve_model_class(model)
+
+    if model_class is None:
+        return None
+
+    return model_class, get_effective_spec(model_class)
+
+
+# pre-warm the spec cache so the first device setup doesn't pay for it
+for _cls in set(model_to_class.values()):
+    get_effective_spec(_cls)